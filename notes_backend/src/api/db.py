@@ -1,15 +1,18 @@
 """
-Database initialization and session management using SQLAlchemy.
+Database initialization and session management using async SQLAlchemy.
 """
 
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncGenerator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
-from sqlalchemy.pool import StaticPool
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
 from .settings import get_settings
 
@@ -20,48 +23,125 @@ class Base(DeclarativeBase):
 
 
 _engine = None
-_SessionLocal: sessionmaker[Session] | None = None
+_SessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+# Debug-mode query counter. A mutable holder is stored in the context var so
+# increments made inside the middleware's inner task remain visible to the
+# middleware that installed the holder.
+_query_counter: ContextVar[list[int] | None] = ContextVar("query_counter", default=None)
+
+
+# PUBLIC_INTERFACE
+def start_query_count() -> list[int]:
+    """Install a fresh per-request query counter and return its holder."""
+    holder = [0]
+    _query_counter.set(holder)
+    return holder
+
+
+def _async_url(url: str) -> str:
+    """Map a sync database URL onto its async driver equivalent."""
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("postgresql+psycopg2://"):
+        return url.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1)
+    return url
 
 
 def _build_engine():
     settings = get_settings()
-    url = settings.database_url
+    url = _async_url(settings.database_url)
 
     # Special handling for SQLite in-memory or file to ensure proper pooling in single-process
     if url.startswith("sqlite"):
-        engine = create_engine(
+        if url.endswith(":memory:"):
+            # In-memory databases live on a single connection; a QueuePool would
+            # hand out separate (empty) databases per connection.
+            engine = create_async_engine(url, poolclass=StaticPool)
+        else:
+            engine = create_async_engine(
+                url,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                pool_recycle=settings.db_pool_recycle,
+                pool_timeout=settings.db_pool_timeout,
+            )
+
+            # Tune SQLite for concurrent access: WAL lets readers proceed while
+            # a writer holds the lock, busy_timeout absorbs transient contention
+            # instead of raising SQLITE_BUSY, and the enlarged page cache keeps
+            # hot note pages in memory. Not applicable to :memory: databases.
+            @event.listens_for(engine.sync_engine, "connect")
+            def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+                cursor = dbapi_conn.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA busy_timeout=30000")
+                cursor.execute("PRAGMA cache_size=-64000")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.close()
+    else:
+        engine = create_async_engine(
             url,
-            connect_args={"check_same_thread": False},
-            poolclass=StaticPool if url.endswith(":memory:") else None,  # type: ignore[arg-type]
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=True,
+            pool_timeout=settings.db_pool_timeout,
         )
-    else:
-        engine = create_engine(url)
 
     return engine
 
 
 # PUBLIC_INTERFACE
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    FastAPI dependency. Yields a SQLAlchemy session and ensures it is closed.
+    FastAPI dependency. Yields an async SQLAlchemy session and ensures it is closed.
+
+    FastAPI caches dependency results per request (use_cache=True), so every
+    dependant within one request shares a single session and pool checkout.
 
     Yields:
-        Session: SQLAlchemy session.
+        AsyncSession: SQLAlchemy async session.
     """
     if _SessionLocal is None:
         raise RuntimeError("Database session factory not initialized. Did you call init_db()?")
 
-    db: Session = _SessionLocal()
+    db: AsyncSession = _SessionLocal()
     try:
         yield db
     finally:
-        db.close()
+        await db.close()
+
+
+# PUBLIC_INTERFACE
+async def get_db_tx(db: AsyncSession = Depends(get_db)) -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency wrapping a request in a single transaction.
 
+    Yields the request-scoped session from get_db (same instance thanks to
+    dependency caching) and commits once after the endpoint returns, rolling
+    back on error. Repositories flush but do not commit, so one request is
+    one transaction with one commit.
 
-@contextmanager
-def session_scope() -> Generator[Session, None, None]:
+    Yields:
+        AsyncSession: SQLAlchemy async session.
     """
-    Context manager for a transactional SQLAlchemy session.
+    try:
+        yield db
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async context manager for a transactional SQLAlchemy session.
     """
     if _SessionLocal is None:
         raise RuntimeError("Database session factory not initialized. Did you call init_db()?")
@@ -69,34 +149,52 @@ def session_scope() -> Generator[Session, None, None]:
     session = _SessionLocal()
     try:
         yield session
-        session.commit()
+        await session.commit()
     except Exception:
-        session.rollback()
+        await session.rollback()
         raise
     finally:
-        session.close()
+        await session.close()
 
 
 # PUBLIC_INTERFACE
-def init_db() -> None:
+async def init_db() -> None:
     """Initialize database engine, session factory, and create tables."""
     global _engine, _SessionLocal
     if _engine is None:
         _engine = _build_engine()
 
     if _SessionLocal is None:
-        _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
+        # expire_on_commit=False keeps returned instances usable after the
+        # request commit instead of expiring every attribute and forcing a
+        # reload SELECT during response serialization.
+        _SessionLocal = async_sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=_engine
+        )
 
-    # Import models and create tables
+    if get_settings().debug:
+        # Count every statement so the debug middleware can flag routes that
+        # regress into N+1 query patterns.
+        @event.listens_for(_engine.sync_engine, "before_cursor_execute")
+        def _count_query(_conn, _cursor, _statement, _parameters, _context, _executemany):
+            holder = _query_counter.get()
+            if holder is not None:
+                holder[0] += 1
+
+    # Import models and create tables. After the first deploy the create_all
+    # reflection checks are wasted startup work, so production deployments set
+    # AUTO_CREATE_TABLES=0 and manage the schema through external migrations.
     from .models.note import Note  # noqa: F401
 
-    Base.metadata.create_all(bind=_engine)
+    if get_settings().auto_create_tables:
+        async with _engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
 
 
 # PUBLIC_INTERFACE
-def shutdown_db() -> None:
+async def shutdown_db() -> None:
     """Dispose of the database engine."""
     global _engine
     if _engine is not None:
-        _engine.dispose()
+        await _engine.dispose()
         _engine = None
@@ -12,54 +12,73 @@ Swagger/OpenAPI:
 - Exposes comprehensive API documentation at /docs and JSON at /openapi.json
 """
 
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.responses import JSONResponse
 
 from .settings import get_settings
-from .db import init_db, shutdown_db
+from .db import init_db, shutdown_db, start_query_count
 from .routers.notes import router as notes_router
 
+logger = logging.getLogger(__name__)
+
 
-def _get_cors_origins(raw: str | None) -> list[str]:
-    if not raw or raw.strip() == "" or raw.strip() == "*":
-        return ["*"]
-    # split by comma and strip spaces
-    return [o.strip() for o in raw.split(",") if o.strip()]
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    """Initialize the database on startup and dispose of it on shutdown."""
+    await init_db()
+    yield
+    await shutdown_db()
 
 
 def _create_app() -> FastAPI:
     settings = get_settings()
 
     app = FastAPI(
+        lifespan=_lifespan,
         title="Notes Backend API",
         description="A simple Notes application API with CRUD operations for notes.",
         version="1.0.0",
+        default_response_class=ORJSONResponse,
         openapi_tags=[
             {"name": "Health", "description": "Service status endpoints"},
             {"name": "Notes", "description": "CRUD operations for notes"},
         ],
     )
 
-    # Configure CORS
-    allow_origins = _get_cors_origins(settings.cors_allow_origins)
+    # Configure CORS. With a "*" wildcard, credentials must stay disabled so
+    # Starlette can short-circuit with a static allow-all response instead of
+    # echoing the Origin header back on every request.
+    allow_origins = list(settings.cors_origins)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=allow_origins,
-        allow_credentials=True,
+        allow_credentials=allow_origins != ["*"],
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
-    # Lifespan events
-    @app.on_event("startup")
-    async def on_startup() -> None:
-        # Initialize DB (create tables if not exists)
-        init_db()
-
-    @app.on_event("shutdown")
-    async def on_shutdown() -> None:
-        shutdown_db()
+    if settings.debug:
+        # Per-request query budget guard: flags routes that regress into N+1
+        # query patterns. Only installed in debug mode, so production requests
+        # pay nothing for it.
+        @app.middleware("http")
+        async def query_count_guard(request, call_next):
+            holder = start_query_count()
+            response = await call_next(request)
+            count = holder[0]
+            if count > settings.db_query_budget:
+                logger.warning(
+                    "%s %s issued %d queries (budget %d)",
+                    request.method, request.url.path, count, settings.db_query_budget,
+                )
+            else:
+                logger.debug("%s %s issued %d queries", request.method, request.url.path, count)
+            return response
 
     # Health endpoint
     @app.get(
@@ -4,25 +4,35 @@ SQLAlchemy model for Note.
 
 from __future__ import annotations
 
-from datetime import datetime
-from sqlalchemy import Integer, String, Text, DateTime, func
+import time
+
+from sqlalchemy import BigInteger, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..db import Base
 
 
+def _now_ms() -> int:
+    """Current time as epoch milliseconds."""
+    return int(time.time() * 1000)
+
+
 class Note(Base):
-    """Database model representing a note."""
+    """Database model representing a note.
+
+    Timestamps are stored as epoch milliseconds: integer comparison makes
+    ordering and indexing cheaper than text-stored datetimes (notably on
+    SQLite) and the rows are smaller. The API layer renders them as ISO
+    datetimes.
+    """
 
     __tablename__ = "notes"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False, default="")
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
-    )
+    created_at_ms: Mapped[int] = mapped_column(BigInteger, default=_now_ms, nullable=False, index=True)
+    updated_at_ms: Mapped[int] = mapped_column(BigInteger, default=_now_ms, onupdate=_now_ms, nullable=False)
 
     def __repr__(self) -> str:
         return f"<Note id={self.id} title={self.title!r}>"
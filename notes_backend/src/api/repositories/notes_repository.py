@@ -6,44 +6,93 @@ from __future__ import annotations
 
 from typing import Optional
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select, delete
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import lambda_stmt, select, insert, update, delete
 
 from ..models.note import Note
 
 
 class NotesRepository:
-    """Encapsulates database operations for notes."""
+    """
+    Encapsulates database operations for notes.
 
-    def __init__(self, db: Session) -> None:
+    Write methods flush but never commit; the commit belongs to the caller
+    (the get_db_tx request dependency or session_scope), so one request is
+    one transaction.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
-    def list_notes(self, skip: int = 0, limit: int = 50) -> list[Note]:
-        stmt = select(Note).offset(skip).limit(limit)
-        return list(self.db.scalars(stmt).all())
+    async def list_notes(self, skip: int = 0, limit: int = 50, before_id: int | None = None) -> list[RowMapping]:
+        # Select plain columns: the read-only listing skips ORM instance
+        # construction and identity-map bookkeeping entirely. lambda_stmt
+        # caches the compiled SQL by lambda identity, so repeated calls only
+        # bind new parameter values instead of recompiling.
+        stmt = lambda_stmt(
+            lambda: select(
+                Note.id, Note.title, Note.content, Note.created_at_ms, Note.updated_at_ms
+            ).order_by(Note.id.desc())
+        )
+        stmt += lambda s: s.limit(limit)
+        if before_id is not None:
+            # Keyset pagination: O(limit) via the primary key instead of the
+            # O(skip + limit) row scan that OFFSET performs.
+            stmt += lambda s: s.where(Note.id < before_id)
+        else:
+            stmt += lambda s: s.offset(skip)
+        return list((await self.db.execute(stmt)).mappings())
+
+    async def get_note(self, note_id: int) -> Optional[Note]:
+        return await self.db.get(Note, note_id)
 
-    def get_note(self, note_id: int) -> Optional[Note]:
-        return self.db.get(Note, note_id)
+    async def create_note(self, title: str, content: str) -> Note:
+        if self.db.get_bind().dialect.insert_returning:
+            # Single round-trip: RETURNING hands back the server-defaulted
+            # id/timestamps, so no post-commit refresh SELECT is needed.
+            stmt = insert(Note).values(title=title, content=content or "").returning(Note)
+            return (await self.db.execute(stmt)).scalar_one()
 
-    def create_note(self, title: str, content: str) -> Note:
+        # Fallback for dialects without INSERT ... RETURNING support. The
+        # flush applies the Python-side defaults, so no refresh is needed.
         note = Note(title=title, content=content or "")
         self.db.add(note)
-        self.db.commit()
-        self.db.refresh(note)
+        await self.db.flush()
         return note
 
-    def update_note(self, note: Note, *, title: str | None = None, content: str | None = None) -> Note:
-        if title is not None:
-            note.title = title
-        if content is not None:
-            note.content = content
-        self.db.add(note)
-        self.db.commit()
-        self.db.refresh(note)
+    async def create_many(self, items: list[dict]) -> int:
+        # executemany: one prepared statement and one round-trip for the
+        # whole batch instead of one INSERT per note.
+        await self.db.execute(insert(Note), items)
+        return len(items)
+
+    async def update_by_id(self, note_id: int, **fields) -> Optional[Note]:
+        if self.db.get_bind().dialect.update_returning:
+            # One statement instead of SELECT + UPDATE + refresh SELECT;
+            # a missing row simply returns no result (no rowcount games).
+            stmt = update(Note).where(Note.id == note_id).values(**fields).returning(Note)
+            return (await self.db.execute(stmt)).scalar_one_or_none()
+
+        # Fallback for dialects without UPDATE ... RETURNING support.
+        note = await self.db.get(Note, note_id)
+        if note is None:
+            return None
+        for key, value in fields.items():
+            setattr(note, key, value)
+        await self.db.flush()
         return note
 
-    def delete_note(self, note_id: int) -> bool:
-        stmt = delete(Note).where(Note.id == note_id)
-        res = self.db.execute(stmt)
-        self.db.commit()
+    async def delete_note(self, note_id: int) -> bool:
+        if self.db.get_bind().dialect.delete_returning:
+            # RETURNING makes the existence check portable; rowcount semantics
+            # vary by driver (some report -1 or nothing useful).
+            stmt = lambda_stmt(lambda: delete(Note).returning(Note.id))
+            stmt += lambda s: s.where(Note.id == note_id)
+            deleted_id = (await self.db.execute(stmt)).scalar_one_or_none()
+            return deleted_id is not None
+
+        # Fallback for dialects without DELETE ... RETURNING support.
+        stmt = lambda_stmt(lambda: delete(Note)) + (lambda s: s.where(Note.id == note_id))
+        res = await self.db.execute(stmt)
         return res.rowcount > 0
@@ -4,20 +4,34 @@ API router for Notes endpoints.
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
-from sqlalchemy.orm import Session
+from typing import Annotated
 
-from ..db import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Response, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db import get_db, get_db_tx
 from ..services.notes_service import NotesService
-from ..schemas.note import NoteCreate, NoteOut, NoteUpdate
+from ..schemas.note import NOTE_OUT_LIST, NoteCreate, NoteOut, NoteUpdate
 
 router = APIRouter(prefix="/notes", tags=["Notes"])
 
 
-def get_service(db: Session = Depends(get_db)) -> NotesService:
+def get_service(db: AsyncSession = Depends(get_db)) -> NotesService:
     return NotesService(db)
 
 
+def get_service_tx(db: AsyncSession = Depends(get_db_tx)) -> NotesService:
+    """Service bound to the request transaction; used by write endpoints."""
+    return NotesService(db)
+
+
+# Annotated aliases keep signature introspection cheap and the handlers terse.
+ServiceDep = Annotated[NotesService, Depends(get_service)]
+ServiceTxDep = Annotated[NotesService, Depends(get_service_tx)]
+NoteIdDep = Annotated[int, Path(..., ge=1, description="ID of the note")]
+
+
 @router.get(
     "",
     summary="List notes",
@@ -26,13 +40,21 @@ def get_service(db: Session = Depends(get_db)) -> NotesService:
     responses={200: {"description": "List of notes returned successfully"}},
 )
 # PUBLIC_INTERFACE
-def list_notes(
+async def list_notes(
+    service: ServiceDep,
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of items to return"),
-    service: NotesService = Depends(get_service),
-) -> list[NoteOut]:
-    """List notes with pagination."""
-    return service.list_notes(skip=skip, limit=limit)
+    before_id: int | None = Query(
+        None, ge=1, description="Return notes with ID below this value (keyset pagination; skip is ignored)"
+    ),
+) -> ORJSONResponse:
+    """List notes with pagination, newest first."""
+    notes = await service.list_notes(skip=skip, limit=limit, before_id=before_id)
+    # Returning a Response directly bypasses FastAPI's per-request adapter
+    # construction; the precompiled TypeAdapter validates and dumps the whole
+    # list in bulk. The response_model above still documents the schema.
+    models = NOTE_OUT_LIST.validate_python(notes)
+    return ORJSONResponse(NOTE_OUT_LIST.dump_python(models, mode="json"))
 
 
 @router.post(
@@ -47,14 +69,35 @@ def list_notes(
     },
 )
 # PUBLIC_INTERFACE
-def create_note(payload: NoteCreate, service: NotesService = Depends(get_service)) -> NoteOut:
+async def create_note(payload: NoteCreate, service: ServiceTxDep) -> NoteOut:
     """Create a note and return the created resource."""
     try:
-        return service.create_note(title=payload.title, content=payload.content)
+        return await service.create_note(title=payload.title, content=payload.content)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
+@router.post(
+    "/batch",
+    summary="Create notes in bulk",
+    description="Create multiple notes in a single request and transaction.",
+    status_code=status.HTTP_201_CREATED,
+    response_model=dict,
+    responses={
+        201: {"description": "Notes created successfully"},
+        400: {"description": "Invalid input"},
+    },
+)
+# PUBLIC_INTERFACE
+async def create_notes_batch(payload: list[NoteCreate], service: ServiceTxDep) -> dict:
+    """Create a batch of notes and return how many were created."""
+    try:
+        created = await service.create_many([(item.title, item.content) for item in payload])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return {"created": created}
+
+
 @router.get(
     "/{note_id}",
     summary="Get a note",
@@ -66,12 +109,9 @@ def create_note(payload: NoteCreate, service: NotesService = Depends(get_service
     },
 )
 # PUBLIC_INTERFACE
-def get_note(
-    note_id: int = Path(..., ge=1, description="ID of the note to retrieve"),
-    service: NotesService = Depends(get_service),
-) -> NoteOut:
+async def get_note(note_id: NoteIdDep, service: ServiceDep) -> NoteOut:
     """Get a note by ID."""
-    note = service.get_note(note_id)
+    note = await service.get_note(note_id)
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
     return note
@@ -89,14 +129,10 @@ def get_note(
     },
 )
 # PUBLIC_INTERFACE
-def update_note(
-    payload: NoteCreate,
-    note_id: int = Path(..., ge=1, description="ID of the note to update"),
-    service: NotesService = Depends(get_service),
-) -> NoteOut:
+async def update_note(payload: NoteCreate, note_id: NoteIdDep, service: ServiceTxDep) -> NoteOut:
     """Update a note by replacing its title and content."""
     try:
-        updated = service.update_note(note_id, title=payload.title, content=payload.content)
+        updated = await service.update_note(note_id, title=payload.title, content=payload.content)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     if not updated:
@@ -116,14 +152,10 @@ def update_note(
     },
 )
 # PUBLIC_INTERFACE
-def patch_note(
-    payload: NoteUpdate,
-    note_id: int = Path(..., ge=1, description="ID of the note to update"),
-    service: NotesService = Depends(get_service),
-) -> NoteOut:
+async def patch_note(payload: NoteUpdate, note_id: NoteIdDep, service: ServiceTxDep) -> NoteOut:
     """Partially update a note."""
     try:
-        updated = service.update_note(note_id, title=payload.title, content=payload.content)
+        updated = await service.update_note(note_id, title=payload.title, content=payload.content)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     if not updated:
@@ -131,8 +163,6 @@ def patch_note(
     return updated
 
 
-from fastapi import Response
-
 @router.delete(
     "/{note_id}",
     summary="Delete a note",
@@ -145,17 +175,14 @@ from fastapi import Response
     },
 )
 # PUBLIC_INTERFACE
-def delete_note(
-    note_id: int = Path(..., ge=1, description="ID of the note to delete"),
-    service: NotesService = Depends(get_service),
-) -> Response:
+async def delete_note(note_id: NoteIdDep, service: ServiceTxDep) -> Response:
     """
     Delete a note. Returns 204 No Content on success.
 
     FastAPI enforces that 204 responses must not include a response body.
     We therefore return an empty Response with status_code=204.
     """
-    deleted = service.delete_note(note_id)
+    deleted = await service.delete_note(note_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Note not found")
     # Return an explicit empty response to avoid any implicit body serialization.
@@ -4,8 +4,8 @@ Pydantic schemas for Note API.
 
 from __future__ import annotations
 
-from datetime import datetime
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 
 class NoteBase(BaseModel):
@@ -30,11 +30,23 @@ class NoteUpdate(BaseModel):
 class NoteOut(BaseModel):
     """Schema for returning a note to clients."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Unique identifier of the note")
     title: str = Field(..., description="Title of the note")
     content: str = Field(..., description="Content of the note")
-    created_at: datetime = Field(..., description="Creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    created_at: datetime = Field(..., description="Creation timestamp", validation_alias="created_at_ms")
+    updated_at: datetime = Field(..., description="Last update timestamp", validation_alias="updated_at_ms")
+
+    @field_validator("created_at", "updated_at", mode="before")
+    @classmethod
+    def _from_epoch_ms(cls, value: object) -> object:
+        """Render the stored epoch-millisecond timestamps as UTC datetimes."""
+        if isinstance(value, int):
+            return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+        return value
+
 
-    class Config:
-        from_attributes = True
+# Built once at import: FastAPI would otherwise construct an equivalent
+# adapter per request when bulk-validating list responses.
+NOTE_OUT_LIST = TypeAdapter(list[NoteOut])
@@ -4,54 +4,114 @@ Service layer encapsulating business logic for Notes.
 
 from __future__ import annotations
 
+import threading
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..repositories.notes_repository import NotesRepository
 from ..models.note import Note
 
+# Short-lived read cache shared across requests. The TTL bounds staleness and
+# every write clears it, so hits only serve repeated identical reads.
+_read_cache: TTLCache = TTLCache(maxsize=1024, ttl=5)
+_read_cache_lock = threading.Lock()
+
 
 class NotesService:
     """Provides operations on notes with validation and business rules."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.repo = NotesRepository(db)
 
+    @staticmethod
+    def _cache_get(key: tuple):
+        with _read_cache_lock:
+            return _read_cache.get(key)
+
+    @staticmethod
+    def _cache_set(key: tuple, value) -> None:
+        with _read_cache_lock:
+            _read_cache[key] = value
+
+    @staticmethod
+    def _cache_clear() -> None:
+        with _read_cache_lock:
+            _read_cache.clear()
+
     # PUBLIC_INTERFACE
-    def list_notes(self, skip: int = 0, limit: int = 50) -> list[Note]:
-        """Return a paginated list of notes."""
+    async def list_notes(self, skip: int = 0, limit: int = 50, before_id: int | None = None) -> list[RowMapping]:
+        """Return a paginated list of notes, newest first.
+
+        When before_id is given, keyset pagination is used and skip is ignored.
+        """
         limit = max(1, min(limit, 100))  # enforce sane limits
         skip = max(0, skip)
-        return self.repo.list_notes(skip=skip, limit=limit)
+        key = ("list", skip, limit, before_id)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        notes = await self.repo.list_notes(skip=skip, limit=limit, before_id=before_id)
+        self._cache_set(key, notes)
+        return notes
 
     # PUBLIC_INTERFACE
-    def get_note(self, note_id: int) -> Optional[Note]:
+    async def get_note(self, note_id: int) -> Optional[Note]:
         """Retrieve a single note by ID."""
-        return self.repo.get_note(note_id)
+        key = ("note", note_id)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        note = await self.repo.get_note(note_id)
+        if note is not None:
+            self._cache_set(key, note)
+        return note
 
     # PUBLIC_INTERFACE
-    def create_note(self, title: str, content: str) -> Note:
+    async def create_note(self, title: str, content: str) -> Note:
         """Create a new note after basic validation."""
         if not title or not title.strip():
             raise ValueError("Title is required")
-        return self.repo.create_note(title=title.strip(), content=content or "")
+        self._cache_clear()
+        return await self.repo.create_note(title=title.strip(), content=content or "")
 
     # PUBLIC_INTERFACE
-    def update_note(self, note_id: int, *, title: str | None, content: str | None) -> Optional[Note]:
-        """Update an existing note if it exists; returns None if not found."""
-        note = self.repo.get_note(note_id)
-        if not note:
-            return None
+    async def create_many(self, items: list[tuple[str, str]]) -> int:
+        """Create several notes in one batch; items are (title, content) pairs."""
+        rows: list[dict[str, str]] = []
+        for title, content in items:
+            if not title or not title.strip():
+                raise ValueError("Title is required for every note")
+            rows.append({"title": title.strip(), "content": content or ""})
+        if not rows:
+            return 0
+        self._cache_clear()
+        return await self.repo.create_many(rows)
 
+    # PUBLIC_INTERFACE
+    async def update_note(self, note_id: int, *, title: str | None, content: str | None) -> Optional[Note]:
+        """Update an existing note if it exists; returns None if not found."""
         new_title = title.strip() if isinstance(title, str) else None
         if new_title is not None and new_title == "":
             # prevent empty title when provided
             raise ValueError("Title cannot be empty")
 
-        return self.repo.update_note(note, title=new_title, content=content)
+        fields: dict[str, str] = {}
+        if new_title is not None:
+            fields["title"] = new_title
+        if content is not None:
+            fields["content"] = content
+        if not fields:
+            # Nothing to change; just report whether the note exists.
+            return await self.repo.get_note(note_id)
+
+        self._cache_clear()
+        return await self.repo.update_by_id(note_id, **fields)
 
     # PUBLIC_INTERFACE
-    def delete_note(self, note_id: int) -> bool:
+    async def delete_note(self, note_id: int) -> bool:
         """Delete a note by ID, returning True if deleted."""
-        return self.repo.delete_note(note_id)
+        self._cache_clear()
+        return await self.repo.delete_note(note_id)
@@ -4,7 +4,7 @@ Application settings management.
 Loads configuration from environment variables and .env using pydantic-settings.
 """
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 import os
@@ -24,6 +24,43 @@ class Settings(BaseModel):
         default_factory=lambda: os.getenv("CORS_ALLOW_ORIGINS", "*"),
         description="Comma-separated list of CORS origins, or *",
     )
+    db_pool_size: int = Field(
+        default_factory=lambda: int(os.getenv("DB_POOL_SIZE", "20")),
+        description="Number of connections kept open in the pool",
+    )
+    db_max_overflow: int = Field(
+        default_factory=lambda: int(os.getenv("DB_MAX_OVERFLOW", "40")),
+        description="Extra connections allowed beyond pool_size under load",
+    )
+    db_pool_recycle: int = Field(
+        default_factory=lambda: int(os.getenv("DB_POOL_RECYCLE", "3600")),
+        description="Seconds after which pooled connections are recycled",
+    )
+    db_pool_timeout: int = Field(
+        default_factory=lambda: int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        description="Seconds to wait for a pooled connection before erroring",
+    )
+
+    debug: bool = Field(
+        default_factory=lambda: os.getenv("DEBUG", "0") == "1",
+        description="Enable debug instrumentation such as the per-request query counter",
+    )
+    db_query_budget: int = Field(
+        default_factory=lambda: int(os.getenv("DB_QUERY_BUDGET", "10")),
+        description="Max queries per request before the debug counter logs a warning",
+    )
+    auto_create_tables: bool = Field(
+        default_factory=lambda: os.getenv("AUTO_CREATE_TABLES", "1") == "1",
+        description="Create tables at startup; disable in production and run migrations externally",
+    )
+
+    @cached_property
+    def cors_origins(self) -> tuple[str, ...]:
+        """Parsed CORS origins; computed once per settings instance."""
+        raw = self.cors_allow_origins
+        if not raw or raw.strip() == "" or raw.strip() == "*":
+            return ("*",)
+        return tuple(o.strip() for o in raw.split(",") if o.strip())
 
 
 # PUBLIC_INTERFACE